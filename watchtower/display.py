@@ -4,6 +4,8 @@ Terminal Display — What the developer actually sees.
 Clean, colored output that makes loops impossible to miss.
 """
 
+from bisect import bisect_right
+
 from .loop_score import LoopResult, Step
 
 # ANSI color codes
@@ -18,75 +20,88 @@ CYAN = "\033[96m"
 WHITE = "\033[97m"
 
 
-def format_step(step: Step, result: LoopResult) -> str:
-    """Format a single step for terminal output."""
+SEP50 = "─" * 50
+RED_SEP = f"{RED}{SEP50}{RESET}"
+DIM_SEP = f"{DIM}{SEP50}{RESET}"
+
+# step number, node name, action, status
+STEP_TMPL = f"{DIM}[watchtower]{RESET} {GRAY}step %2d{RESET} {CYAN}%s{RESET}%s%s"
 
-    step_num = f"{DIM}[watchtower]{RESET} "
-    step_num += f"{GRAY}step {step.step_number:>2}{RESET}"
+# Status indicator by score: below 0.3, below 0.5, below 0.7, and above
+_STATUS_BINS = [0.3, 0.5, 0.7]
+_STATUS_TMPLS = [
+    f" {GREEN}✓{RESET}",
+    f" {YELLOW}~{RESET} {DIM}score:%s{RESET}",
+    f" {YELLOW}⚡ repeat{RESET} {DIM}score:%s{RESET}",
+    f" {RED}⚡ repeat{RESET} {DIM}score:%s{RESET}",
+]
 
-    # Node name
-    node = f" {CYAN}{step.node_name}{RESET}"
+
+def format_step(step: Step, result: LoopResult) -> str:
+    """Format a single step for terminal output."""
 
     # Tool calls OR action label
-    action = ""
     if step.tool_calls:
-        tool_str = ", ".join(step.tool_calls[:2])
-        if len(step.tool_calls) > 2:
-            tool_str += f" +{len(step.tool_calls) - 2}"
-        action = f" → {WHITE}{tool_str}{RESET}"
+        action = _format_tool_calls(step.tool_calls)
     elif step.action_label:
         action = f" → {DIM}{step.action_label}{RESET}"
+    else:
+        action = ""
 
     # Status indicator
-    if result.score < 0.3:
-        status = f" {GREEN}✓{RESET}"
-    elif result.score < 0.5:
-        status = f" {YELLOW}~{RESET} {DIM}score:{result.score}{RESET}"
-    elif result.score < 0.7:
-        status = f" {YELLOW}⚡ repeat{RESET} {DIM}score:{result.score}{RESET}"
-    else:
-        status = f" {RED}⚡ repeat{RESET} {DIM}score:{result.score}{RESET}"
+    idx = bisect_right(_STATUS_BINS, result.score)
+    status = _STATUS_TMPLS[idx] % result.score if idx else _STATUS_TMPLS[0]
+
+    return STEP_TMPL % (step.step_number, step.node_name, action, status)
+
+
+def format_unscored_step(step_number: int, node_name: str) -> str:
+    """Format a step that was passed through without scoring."""
+    return STEP_TMPL % (step_number, node_name, "", "")
+
 
-    return f"{step_num}{node}{action}{status}"
+def _format_tool_calls(tool_calls: list[str]) -> str:
+    """Show the first two tool calls, plus a count of the rest."""
+    tool_str = ", ".join(tool_calls[:2])
+    if len(tool_calls) > 2:
+        tool_str += f" +{len(tool_calls) - 2}"
+    return f" → {WHITE}{tool_str}{RESET}"
 
 
 def format_alert(result: LoopResult, detected_at_step: int) -> str:
     """Format the ONE hero alert — dramatic, informative, with ROI."""
-    lines = []
-    lines.append("")
-    lines.append(f"  {RED}{BOLD}⚠️  LOOP DETECTED{RESET}")
-    lines.append(f"  {RED}{'─' * 50}{RESET}")
-    lines.append(f"  {WHITE}Score:     {BOLD}{result.score}{RESET}  {'🔴' if result.score >= 0.8 else '🟡'}")
-    lines.append(f"  {WHITE}Pattern:   {BOLD}{result.pattern}{RESET}  (×{result.repeat_count})")
-    lines.append(f"  {GRAY}Breakdown: node_rep={result.node_repetition}  seq_rep={result.sequence_repetition}  tool_rep={result.tool_repetition}{RESET}")
-    lines.append(f"  {RED}{'─' * 50}{RESET}")
-    lines.append(f"  {YELLOW}⏱  Caught at step {detected_at_step} — without detection this loop would continue indefinitely.{RESET}")
-    lines.append("")
-    return "\n".join(lines)
+    return (
+        f"\n"
+        f"  {RED}{BOLD}⚠️  LOOP DETECTED{RESET}\n"
+        f"  {RED_SEP}\n"
+        f"  {WHITE}Score:     {BOLD}{result.score}{RESET}  {'🔴' if result.score >= 0.8 else '🟡'}\n"
+        f"  {WHITE}Pattern:   {BOLD}{result.pattern}{RESET}  (×{result.repeat_count})\n"
+        f"  {GRAY}Breakdown: node_rep={result.node_repetition}  seq_rep={result.sequence_repetition}  tool_rep={result.tool_repetition}{RESET}\n"
+        f"  {RED_SEP}\n"
+        f"  {YELLOW}⏱  Caught at step {detected_at_step} — without detection this loop would continue indefinitely.{RESET}\n"
+    )
 
 
 def format_summary(total_steps: int, alerts: int, max_score: float) -> str:
     """Format end-of-run summary."""
-    lines = []
-    lines.append("")
-    lines.append(f"  {DIM}{'─' * 50}{RESET}")
-    lines.append(f"  {BOLD}watchtower summary{RESET}")
-    lines.append(f"  {GRAY}Steps monitored:  {WHITE}{total_steps}{RESET}")
-    lines.append(f"  {GRAY}Loop detected:    {RED + 'yes' if alerts > 0 else GREEN + 'no'}{RESET}")
-    lines.append(f"  {GRAY}Peak loop score:  {RED if max_score >= 0.7 else GREEN}{max_score}{RESET}")
-    lines.append(f"  {DIM}{'─' * 50}{RESET}")
-    lines.append("")
-    return "\n".join(lines)
+    return (
+        f"\n"
+        f"  {DIM_SEP}\n"
+        f"  {BOLD}watchtower summary{RESET}\n"
+        f"  {GRAY}Steps monitored:  {WHITE}{total_steps}{RESET}\n"
+        f"  {GRAY}Loop detected:    {RED + 'yes' if alerts > 0 else GREEN + 'no'}{RESET}\n"
+        f"  {GRAY}Peak loop score:  {RED if max_score >= 0.7 else GREEN}{max_score}{RESET}\n"
+        f"  {DIM_SEP}\n"
+    )
 
 
 def format_start(framework: str) -> str:
     """Format the startup banner."""
-    lines = []
-    lines.append("")
-    lines.append(f"  {DIM}{'─' * 50}{RESET}")
-    lines.append(f"  {BOLD}🗼 watchtower{RESET} {DIM}v0.1.0{RESET}")
-    lines.append(f"  {GRAY}monitoring: {WHITE}{framework}{RESET}")
-    lines.append(f"  {GRAY}metrics:    {WHITE}Loop Score{RESET}")
-    lines.append(f"  {DIM}{'─' * 50}{RESET}")
-    lines.append("")
-    return "\n".join(lines)
+    return (
+        f"\n"
+        f"  {DIM_SEP}\n"
+        f"  {BOLD}🗼 watchtower{RESET} {DIM}v0.1.0{RESET}\n"
+        f"  {GRAY}monitoring: {WHITE}{framework}{RESET}\n"
+        f"  {GRAY}metrics:    {WHITE}Loop Score{RESET}\n"
+        f"  {DIM_SEP}\n"
+    )
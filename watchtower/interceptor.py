@@ -6,10 +6,12 @@ extract relevant data, feed it to Loop Detector, and print results.
 """
 
 import json
+import sys
+from functools import lru_cache
 from typing import Any, Callable, Optional
 
 from .loop_score import LoopDetector, Step, LoopResult
-from .display import format_step, format_alert, format_summary, format_start
+from .display import format_step, format_unscored_step, format_alert, format_summary, format_start
 
 
 class StopMonitoring(Exception):
@@ -17,6 +19,11 @@ class StopMonitoring(Exception):
     pass
 
 
+# What reading an unexpected node output shape can raise. Anything else,
+# including errors from the graph itself, propagates to the caller.
+_MONITORING_ERRORS = (AttributeError, KeyError, TypeError)
+
+
 class WatchtowerInterceptor:
     """
     Wraps a LangGraph compiled graph and monitors execution.
@@ -46,6 +53,11 @@ class WatchtowerInterceptor:
         self.max_score = 0.0
         self.total_steps = 0
         self._hero_alert_fired = False
+        self._monitoring_failed = False
+        # Action labels are display-only; skip deriving them when nothing prints
+        self._needs_labels = not silent
+        # Message class → tool-call extractor, chosen once per class
+        self._msg_extractor_cache: dict[type, Callable[[Any, list[str]], None]] = {}
 
     def invoke(self, input_data: Any, config: Optional[dict] = None, **kwargs) -> Any:
         """
@@ -55,13 +67,14 @@ class WatchtowerInterceptor:
         computes Loop Score, and prints to terminal.
         """
         if not self.silent:
-            print(format_start("LangGraph"))
+            sys.stdout.write(format_start("LangGraph") + "\n")
 
         self.detector.reset()
         self.alerts = []
         self.max_score = 0.0
         self.total_steps = 0
         self._hero_alert_fired = False
+        self._monitoring_failed = False
 
         final_result = None
         config = config or {}
@@ -72,54 +85,85 @@ class WatchtowerInterceptor:
                     if node_name.startswith("__"):
                         continue
 
-                    tool_calls = self._extract_tool_calls(node_output)
-                    action_label = self._extract_action_label(node_output, tool_calls)
+                    self.total_steps += 1
 
-                    step = Step(
-                        node_name=node_name,
-                        tool_calls=tool_calls,
-                        action_label=action_label,
-                    )
+                    # No more alerts can fire: just pass the stream through
+                    if self._hero_alert_fired or self._monitoring_failed:
+                        if not self.silent:
+                            sys.stdout.write(format_unscored_step(self.total_steps, node_name) + "\n")
+                        final_result = node_output
+                        continue
 
-                    result = self.detector.add_step(step)
-                    self.total_steps += 1
-                    self.max_score = max(self.max_score, result.score)
-
-                    # Print step
-                    if not self.silent:
-                        print(format_step(step, result))
-
-                    # Alert logic: ONE hero alert, requires min steps + repeat count
-                    if (
-                        result.is_alert
-                        and not self._hero_alert_fired
-                        and self.total_steps >= self.min_steps
-                        and result.repeat_count >= 3
-                    ):
-                        self._hero_alert_fired = True
-                        self.alerts.append(result)
+                    try:
+                        alert = self._monitor_step(node_name, node_output)
+                    except _MONITORING_ERRORS as e:
+                        # Node output we can't read: keep the run going unmonitored
+                        # rather than failing it or running the graph again
+                        self._monitoring_failed = True
                         if not self.silent:
-                            print(format_alert(result, self.total_steps))
-                        if self.on_loop:
-                            self.on_loop(result)
+                            sys.stdout.write(f"\033[93m  [watchtower] monitoring error: {e}\033[0m\n")
+                            sys.stdout.flush()
+                        final_result = node_output
+                        continue
+
+                    if alert is not None and self.on_loop:
+                        self.on_loop(alert)
 
                     final_result = node_output
 
         except StopMonitoring:
             # Graceful stop triggered by on_loop callback
             if not self.silent:
-                print(format_summary(self.total_steps, len(self.alerts), self.max_score))
+                sys.stdout.write(format_summary(self.total_steps, len(self.alerts), self.max_score) + "\n")
+                sys.stdout.flush()
             return final_result
-        except Exception as e:
-            if not self.silent:
-                print(f"\033[93m  [watchtower] monitoring error: {e}\033[0m")
-            return self.graph.invoke(input_data, config=config, **kwargs)
 
         if not self.silent:
-            print(format_summary(self.total_steps, len(self.alerts), self.max_score))
+            sys.stdout.write(format_summary(self.total_steps, len(self.alerts), self.max_score) + "\n")
+            sys.stdout.flush()
 
         return final_result
 
+    def _monitor_step(self, node_name: str, node_output: Any) -> Optional[LoopResult]:
+        """
+        Score one node execution and print it.
+        
+        Returns the LoopResult if this step fired the hero alert, else None.
+        """
+        tool_calls = self._extract_tool_calls(node_output)
+        action_label = (
+            self._extract_action_label(node_output, tool_calls)
+            if self._needs_labels else ""
+        )
+
+        step = Step(
+            node_name=node_name,
+            tool_calls=tool_calls,
+            action_label=action_label,
+        )
+
+        result = self.detector.add_step(step)
+        self.max_score = max(self.max_score, result.score)
+
+        # Print step
+        if not self.silent:
+            sys.stdout.write(format_step(step, result) + "\n")
+
+        # Alert logic: ONE hero alert, requires min steps + repeat count
+        if (
+            result.is_alert
+            and self.total_steps >= self.min_steps
+            and result.repeat_count >= 3
+        ):
+            self._hero_alert_fired = True
+            self.alerts.append(result)
+            if not self.silent:
+                sys.stdout.write(format_alert(result, self.total_steps) + "\n")
+                sys.stdout.flush()
+            return result
+
+        return None
+
     def _extract_tool_calls(self, output: Any) -> list[str]:
         """Extract tool call signatures from node output."""
         calls = []
@@ -132,19 +176,11 @@ class WatchtowerInterceptor:
                 messages = [messages]
 
             for msg in messages:
-                if hasattr(msg, "tool_calls"):
-                    for tc in msg.tool_calls:
-                        name = tc.get("name", "unknown") if isinstance(tc, dict) else getattr(tc, "name", "unknown")
-                        args = tc.get("args", {}) if isinstance(tc, dict) else getattr(tc, "args", {})
-                        args_str = self._compact_args(args)
-                        calls.append(f"{name}({args_str})")
-
-                elif hasattr(msg, "additional_kwargs"):
-                    for tc in msg.additional_kwargs.get("tool_calls", []):
-                        func = tc.get("function", {})
-                        name = func.get("name", "unknown")
-                        args_str = func.get("arguments", "")
-                        calls.append(f"{name}({self._compact_args(args_str)})")
+                cls = type(msg)
+                extract = self._msg_extractor_cache.get(cls)
+                if extract is None:
+                    extract = self._msg_extractor_cache[cls] = self._pick_msg_extractor(msg)
+                extract(msg, calls)
 
             actions = output.get("actions", [])
             if isinstance(actions, list):
@@ -154,6 +190,38 @@ class WatchtowerInterceptor:
 
         return calls
 
+    def _pick_msg_extractor(self, msg: Any) -> Callable[[Any, list[str]], None]:
+        """
+        Choose how to read tool calls from messages of this type.
+        
+        Probed on the first instance seen and cached per class, so the
+        hot loop skips the hasattr lookups.
+        """
+        if hasattr(msg, "tool_calls"):
+            return self._tool_calls_from_attr
+        if hasattr(msg, "additional_kwargs"):
+            return self._tool_calls_from_kwargs
+        return _no_tool_calls
+
+    def _tool_calls_from_attr(self, msg: Any, calls: list[str]):
+        """LangChain-style `msg.tool_calls` (dicts or objects)."""
+        for tc in msg.tool_calls:
+            if isinstance(tc, dict):
+                name = tc.get("name", "unknown")
+                args = tc.get("args", {})
+            else:
+                name = getattr(tc, "name", "unknown")
+                args = getattr(tc, "args", {})
+            calls.append(f"{name}({self._compact_args(args)})")
+
+    def _tool_calls_from_kwargs(self, msg: Any, calls: list[str]):
+        """OpenAI-style `msg.additional_kwargs["tool_calls"]`."""
+        for tc in msg.additional_kwargs.get("tool_calls", []):
+            func = tc.get("function", {})
+            name = func.get("name", "unknown")
+            args_str = func.get("arguments", "")
+            calls.append(f"{name}({self._compact_args(args_str)})")
+
     def _extract_action_label(self, output: Any, tool_calls: list[str]) -> str:
         """
         Extract a human-readable action label for display.
@@ -166,42 +234,83 @@ class WatchtowerInterceptor:
             return "idle"
 
         if isinstance(output, dict):
-            if "analysis" in output:
-                return "analyze"
-            if "final_output" in output:
-                return "write"
-            if "needs_more_research" in output:
-                val = output["needs_more_research"]
-                return "decide → more research" if val else "decide → done"
-
-            messages = output.get("messages", [])
-            if messages:
-                return "respond"
-
-            keys = [k for k in output.keys() if not k.startswith("_")]
-            if keys:
-                return f"update({', '.join(keys[:2])})"
+            return _label_for_keys(
+                tuple(output),
+                bool(output.get("needs_more_research")),
+                bool(output.get("messages")),
+            )
 
         return "step"
 
     def _compact_args(self, args: Any) -> str:
         """Make tool arguments compact for display."""
+        if isinstance(args, dict):
+            return _compact_dict(args)
         if isinstance(args, str):
-            try:
-                args = json.loads(args)
-            except (json.JSONDecodeError, TypeError):
-                return args[:40] + "..." if len(str(args)) > 40 else str(args)
+            return _compact_args_str(args)
+        return str(args)[:40]
 
-        if isinstance(args, dict):
-            parts = []
-            for k, v in list(args.items())[:2]:
-                v_str = str(v)
-                if len(v_str) > 30:
-                    v_str = v_str[:30] + "..."
-                parts.append(f"{k}={v_str}")
-            result = ", ".join(parts)
-            if len(args) > 2:
-                result += ", ..."
-            return result
 
-        return str(args)[:40]
+def _no_tool_calls(msg: Any, calls: list[str]):
+    """Extractor for message types that carry no tool calls."""
+
+
+@lru_cache(maxsize=64)
+def _label_for_keys(keys: tuple[str, ...], needs_more: bool, has_messages: bool) -> str:
+    """
+    Label a dict node output from its keys, in order, plus the two values
+    the label depends on. A looping node emits the same shape every time.
+    """
+    if "analysis" in keys:
+        return "analyze"
+    if "final_output" in keys:
+        return "write"
+    if "needs_more_research" in keys:
+        return "decide → more research" if needs_more else "decide → done"
+
+    if has_messages:
+        return "respond"
+
+    public = [k for k in keys if not k.startswith("_")]
+    if public:
+        return f"update({', '.join(public[:2])})"
+
+    return "step"
+
+
+@lru_cache(maxsize=1024)
+def _compact_args_str(args: str) -> str:
+    """
+    Compact a raw argument string, parsing it as JSON when it looks like
+    an object or array.
+    
+    Cached on the string itself: a looping agent sends the same payload
+    over and over, and this is the only path that pays for json.loads.
+    Dict args are not cached — equal values can print differently
+    (True == 1), so a value-keyed cache could show the wrong args.
+    """
+    if args.lstrip()[:1] in ("{", "["):
+        try:
+            parsed = json.loads(args)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(parsed, dict):
+                return _compact_dict(parsed)
+            return str(parsed)[:40]
+
+    return args[:40] + "..." if len(args) > 40 else args
+
+
+def _compact_dict(args: dict) -> str:
+    """Show the first two key=value pairs of a dict of tool arguments."""
+    parts = []
+    for k, v in list(args.items())[:2]:
+        v_str = str(v)
+        if len(v_str) > 30:
+            v_str = v_str[:30] + "..."
+        parts.append(f"{k}={v_str}")
+    result = ", ".join(parts)
+    if len(args) > 2:
+        result += ", ..."
+    return result
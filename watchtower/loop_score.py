@@ -7,11 +7,11 @@ three signals: node repetition, sequence cycles, and tool call repeats.
 Score range: 0.0 (no loops) to 1.0 (fully stuck).
 """
 
-from collections import Counter
+from collections import Counter, deque
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """A single execution step captured by the interceptor."""
     node_name: str
@@ -20,7 +20,7 @@ class Step:
     step_number: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopResult:
     """The result of a loop analysis."""
     score: float                    # 0.0 to 1.0
@@ -32,6 +32,14 @@ class LoopResult:
     is_alert: bool                  # True if score >= threshold
 
 
+# Shared result for steps that are not scored; treat as read-only
+_ZERO_RESULT = LoopResult(
+    score=0.0, node_repetition=0.0,
+    sequence_repetition=0.0, tool_repetition=0.0,
+    pattern="", repeat_count=0, is_alert=False
+)
+
+
 class LoopDetector:
     """
     Sliding-window loop detector.
@@ -43,34 +51,60 @@ class LoopDetector:
     def __init__(self, window_size: int = 10, threshold: float = 0.7):
         self.window_size = window_size
         self.threshold = threshold
-        self.steps: list[Step] = []
+        # Alerts need a 2+ node pattern repeated 3+ times, which takes at
+        # least this many steps; scoring is skipped until then
+        self.min_useful_steps = 6
+        # Only the window is kept; older steps fall off the front
+        self.steps: deque[Step] = deque(maxlen=window_size)
+        self._step_counter = 0
+
+        # Node names interned to ints; everything below works on the ids
+        self._name_to_id: dict[str, int] = {}
+        self._id_to_name: list[str] = []
+        self._ids: deque[int] = deque(maxlen=window_size)  # parallel to steps
+
+        # Windowed state, updated by delta as steps arrive and leave
+        self._node_counts: Counter[int] = Counter()
+        self._max_count = 0  # highest value in _node_counts
+        self._tool_counts: Counter[str] = Counter()
+        self._tool_total = 0
 
     def add_step(self, step: Step) -> LoopResult:
         """Add a new step and compute the current Loop Score."""
-        step.step_number = len(self.steps) + 1
+        self._step_counter += 1
+        step.step_number = self._step_counter
+
+        node_id = self._name_to_id.get(step.node_name)
+        if node_id is None:
+            node_id = self._name_to_id[step.node_name] = len(self._id_to_name)
+            self._id_to_name.append(step.node_name)
+
+        # Slide the window: drop the oldest step's counts, add the new one's
+        if len(self.steps) == self.window_size:
+            self._evict()
         self.steps.append(step)
+        self._ids.append(node_id)
+        self._node_counts[node_id] += 1
+        if self._node_counts[node_id] > self._max_count:
+            self._max_count = self._node_counts[node_id]
+        if step.tool_calls:  # most steps carry none
+            for call in step.tool_calls:
+                self._tool_counts[call] += 1
+            self._tool_total += len(step.tool_calls)
 
-        # Only analyze within the window
-        window = self.steps[-self.window_size:]
+        window = self.steps
 
-        if len(window) < 3:
-            return LoopResult(
-                score=0.0, node_repetition=0.0,
-                sequence_repetition=0.0, tool_repetition=0.0,
-                pattern="", repeat_count=0, is_alert=False
-            )
+        if self._step_counter < self.min_useful_steps or len(window) < 3:
+            return _ZERO_RESULT
 
         # --- Signal 1: Node Repetition ---
         # Two sub-signals:
         # a) Concentration: how dominant is the most frequent node?
         # b) Uniqueness: how few unique nodes appear?
         #    If window=10 has only 2 unique nodes, that's suspicious.
-        node_names = [s.node_name for s in window]
-        counts = Counter(node_names)
-        most_common_count = counts.most_common(1)[0][1]
-        concentration = most_common_count / len(window)
+        concentration = self._max_count / len(window)
 
-        unique_nodes = len(counts)
+        unique_nodes = len(self._node_counts)
         # Fewer unique nodes = more suspicious.
         # 1 unique node = 1.0, 2 = 0.8, 3 = 0.6, etc.
         uniqueness_signal = max(0.0, 1.0 - (unique_nodes - 1) * 0.2)
@@ -78,12 +112,12 @@ class LoopDetector:
         node_rep = 0.5 * concentration + 0.5 * uniqueness_signal
 
         # --- Signal 2: Sequence Repetition ---
-        # Look for repeating n-grams (patterns of 2-4 nodes).
-        seq_rep, pattern, repeat_count = self._detect_sequence_pattern(node_names)
+        # Look for the best repeating cycle (2+ nodes) at the end of the window.
+        seq_rep, pattern, repeat_count = self._detect_sequence_pattern()
 
         # --- Signal 3: Tool Call Repetition ---
         # Same tool called with same/similar params?
-        tool_rep = self._detect_tool_repetition(window)
+        tool_rep = self._detect_tool_repetition()
 
         # --- Combine into Loop Score ---
         # Weights: sequence patterns are strongest signal,
@@ -107,65 +141,104 @@ class LoopDetector:
             is_alert=score >= self.threshold
         )
 
-    def _detect_sequence_pattern(self, names: list[str]) -> tuple[float, str, int]:
+    def _detect_sequence_pattern(self) -> tuple[float, str, int]:
         """
-        Find repeating patterns in the node sequence.
+        Find repeating patterns in the node sequence of the window.
         
-        Tries pattern lengths 2, 3, 4.
+        Tries every pattern length from 2 up to half the window in one pass.
         Example: [A, B, A, B, A, B] → pattern "A→B", repeated 3x, score ~1.0
+        
+        Uses the Z-function of the reversed sequence: z[p] is how far the
+        sequence still matches itself when shifted back by p, so the trailing
+        pattern of length p repeats z[p] // p + 1 times.
         """
+        # Every repeat ends with the newest node, so it must occur twice
+        if self._node_counts[self._ids[-1]] < 2:
+            return 0.0, "", 0
+
         best_score = 0.0
         best_pattern = ""
         best_count = 0
 
-        for pattern_len in range(2, min(5, len(names) // 2 + 1)):
-            # Take the last `pattern_len` nodes as candidate pattern
-            candidate = names[-pattern_len:]
-
-            # Count how many times this pattern appears consecutively
-            # going backwards from the end
-            count = 0
-            i = len(names) - pattern_len
-            while i >= 0:
-                segment = names[i:i + pattern_len]
-                if segment == candidate:
-                    count += 1
-                    i -= pattern_len
-                else:
-                    break
+        rev = list(reversed(self._ids))
+        n = len(rev)
+        z = _z_function(rev)
+
+        for pattern_len in range(2, n // 2 + 1):
+            # Count how many times the last `pattern_len` nodes appear
+            # consecutively going backwards from the end
+            count = z[pattern_len] // pattern_len + 1
 
             if count >= 2:
                 # Score: how much of the window is covered by this pattern
-                coverage = (count * pattern_len) / len(names)
+                coverage = (count * pattern_len) / n
                 score = min(1.0, coverage)
 
                 if score > best_score:
                     best_score = score
-                    best_pattern = "→".join(candidate)
+                    best_pattern = "→".join(self._id_to_name[k] for k in reversed(rev[:pattern_len]))
                     best_count = count
 
         return best_score, best_pattern, best_count
 
-    def _detect_tool_repetition(self, window: list[Step]) -> float:
+    def _detect_tool_repetition(self) -> float:
         """
         Check if the same tool calls are being repeated.
         
         Compares tool call strings directly (exact match).
         Returns ratio of repeated calls to total calls.
         """
-        all_calls = []
-        for step in window:
-            all_calls.extend(step.tool_calls)
-
-        if len(all_calls) < 2:
+        if self._tool_total < 2:
             return 0.0
 
-        # Count how many calls are duplicates
-        call_counts = Counter(all_calls)
-        repeated = sum(c - 1 for c in call_counts.values() if c > 1)
-
-        return repeated / len(all_calls)
+        # Every call beyond the first of its kind is a duplicate
+        return (self._tool_total - len(self._tool_counts)) / self._tool_total
+
+    def _evict(self):
+        """Remove the oldest step, about to leave the window, from the running counts."""
+        step, node_id = self.steps[0], self._ids[0]
+        count = self._node_counts[node_id] - 1
+        if count:
+            self._node_counts[node_id] = count
+        else:
+            del self._node_counts[node_id]
+        if count + 1 == self._max_count:
+            # A max holder dropped; the max stays unless it was the only one
+            self._max_count = max(self._node_counts.values(), default=0)
+        if step.tool_calls:
+            for call in step.tool_calls:
+                self._tool_counts[call] -= 1
+                if not self._tool_counts[call]:
+                    del self._tool_counts[call]
+            self._tool_total -= len(step.tool_calls)
 
     def reset(self):
         """Clear all recorded steps."""
-        self.steps = []
+        self.steps = deque(maxlen=self.window_size)
+        self._step_counter = 0
+        self._node_counts.clear()
+        self._max_count = 0
+        self._tool_counts.clear()
+        self._tool_total = 0
+        self._name_to_id.clear()
+        self._id_to_name.clear()
+        self._ids = deque(maxlen=self.window_size)
+
+
+def _z_function(seq: list[int]) -> list[int]:
+    """
+    z[i] = length of the longest common prefix of `seq` and `seq[i:]`.
+    
+    Linear time; z[0] is left at 0.
+    """
+    n = len(seq)
+    z = [0] * n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and seq[z[i]] == seq[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return z